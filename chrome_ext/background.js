@@ -19,6 +19,11 @@ const ALLOWED_COLORS = new Set([
 ]);
 
 const DEFAULT_COLOR = 'blue';
+
+function normalizeGroupColor(color) {
+  return ALLOWED_COLORS.has(color) ? color : DEFAULT_COLOR;
+}
+
 const EXTENSION_VERSION = (() => {
   try {
     return chrome?.runtime?.getManifest?.().version || 'unknown';
@@ -27,8 +32,8 @@ const EXTENSION_VERSION = (() => {
   }
 })();
 
-// Providers registry with URLs and default group colors
-const PROVIDERS = {
+// Providers registry with URLs and default group colors (read-only)
+const PROVIDERS = deepFreeze({
   CHATGPT: {
     key: 'CHATGPT',
     title: 'ChatGPT',
@@ -57,10 +62,13 @@ const PROVIDERS = {
     color: 'red',
     urls: { base: 'https://grok.com' }
   }
-};
+});
+
+const PROVIDER_KEYS = new Set(Object.keys(PROVIDERS));
+const DEFAULT_PROVIDER_ORDER = Object.freeze(['CHATGPT', 'CLAUDE', 'GEMINI', 'GROK']);
 
-const PROVIDER_KEYS = Object.keys(PROVIDERS);
-const DEFAULT_PROVIDER_ORDER = ['CHATGPT', 'CLAUDE', 'GEMINI', 'GROK'];
+// Upper bound on per-provider work (tab injections) in flight at once
+const MAX_PARALLEL_PROVIDERS = 4;
 
 // Session tracking for window relationships (legacy compatibility)
 const sessionWindows = new Map(); // sessionId -> Set<windowId>
@@ -70,10 +78,35 @@ const windowSessions = new Map(); // windowId -> sessionId
 // Utilities
 // ============================================================================
 
+function deepFreeze(obj) {
+  for (const value of Object.values(obj)) {
+    if (value && typeof value === 'object') deepFreeze(value);
+  }
+  return Object.freeze(obj);
+}
+
 function delay(ms) {
   return new Promise((resolve) => setTimeout(resolve, ms));
 }
 
+/**
+ * Map items through an async fn with at most `limit` calls in flight.
+ * Results keep input order.
+ */
+async function mapWithConcurrency(items, limit, fn) {
+  const results = new Array(items.length);
+  let next = 0;
+  const worker = async () => {
+    while (next < items.length) {
+      const i = next++;
+      results[i] = await fn(items[i], i);
+    }
+  };
+  const workerCount = Math.min(Math.max(1, limit), items.length);
+  await Promise.all(Array.from({ length: workerCount }, worker));
+  return results;
+}
+
 function withTimeout(promise, ms, message = 'Operation timed out') {
   let timer = null;
   const timeoutPromise = new Promise((_, reject) => {
@@ -89,6 +122,9 @@ function withTimeout(promise, ms, message = 'Operation timed out') {
 // ============================================================================
 
 const CDP_VERSION = '1.3';
+// Upper bound for a single debugger command so a wedged tab cannot stall
+// the research/recovery flows indefinitely.
+const CDP_COMMAND_TIMEOUT_MS = 10000;
 
 function dbgAttach(tabId) {
   return new Promise((resolve, reject) => {
@@ -106,12 +142,19 @@ function dbgDetach(tabId) {
 }
 
 function dbgSend(tabId, method, params = {}) {
-  return new Promise((resolve, reject) => {
+  const command = new Promise((resolve, reject) => {
     chrome.debugger.sendCommand({ tabId }, method, params, (result) => {
       if (chrome.runtime.lastError) return reject(new Error(chrome.runtime.lastError.message));
       resolve(result);
     });
   });
+  return withTimeout(command, CDP_COMMAND_TIMEOUT_MS, `CDP ${method} timed out`);
+}
+
+// Domain enables are independent, so issue them together rather than
+// paying one debugger round-trip each.
+async function dbgEnableDomains(tabId, domains) {
+  await Promise.all(domains.map((domain) => dbgSend(tabId, `${domain}.enable`)));
 }
 
 async function dbgEval(tabId, expression) {
@@ -185,8 +228,9 @@ function buildEvalWithResearchHelpers(body) {
   })()`;
 }
 
-async function dbgFindModelSelectorButton(tabId, { timeout = 2800 } = {}) {
-  const expr = buildEvalWithResearchHelpers(`
+// The evaluate expressions below are constant, so they are built once at
+// load rather than on every lookup.
+const MODEL_SELECTOR_BUTTON_EXPR = buildEvalWithResearchHelpers(`
     const candidates = Array.from(document.querySelectorAll('button[aria-label], button[aria-haspopup=\"menu\"]')).filter(isVisible);
     candidates.sort((a, b) => a.getBoundingClientRect().top - b.getBoundingClientRect().top);
     for (const btn of candidates) {
@@ -200,11 +244,12 @@ async function dbgFindModelSelectorButton(tabId, { timeout = 2800 } = {}) {
     }
     return null;
   `);
-  return dbgWaitFor(tabId, expr, { timeout, interval: 120 });
+
+async function dbgFindModelSelectorButton(tabId, { timeout = 2800 } = {}) {
+  return dbgWaitFor(tabId, MODEL_SELECTOR_BUTTON_EXPR, { timeout, interval: 120 });
 }
 
-async function dbgFindComposerPlusButton(tabId, { timeout = 3000 } = {}) {
-  const expr = buildEvalWithResearchHelpers(`
+const COMPOSER_PLUS_BUTTON_EXPR = buildEvalWithResearchHelpers(`
     const input = document.querySelector('#prompt-textarea, .ProseMirror, [contenteditable=\"true\"]');
     let plusButton = document.querySelector('[data-testid=\"composer-plus-btn\"]');
     const isCandidate = (btn) => {
@@ -234,16 +279,18 @@ async function dbgFindComposerPlusButton(tabId, { timeout = 3000 } = {}) {
     if (rect.width <= 0 || rect.height <= 0) return null;
     return { x: Math.round(rect.left + rect.width / 2), y: Math.round(rect.top + rect.height / 2) };
   `);
-  return dbgWaitFor(tabId, expr, { timeout, interval: 120 });
+
+async function dbgFindComposerPlusButton(tabId, { timeout = 3000 } = {}) {
+  return dbgWaitFor(tabId, COMPOSER_PLUS_BUTTON_EXPR, { timeout, interval: 120 });
 }
 
+const OPEN_MENU_EXPR = buildEvalWithResearchHelpers(`return !!getOpenMenuRoot();`);
+
 async function dbgWaitForOpenMenu(tabId, { timeout = 2000 } = {}) {
-  const expr = buildEvalWithResearchHelpers(`return !!getOpenMenuRoot();`);
-  return dbgWaitFor(tabId, expr, { timeout, interval: 120 });
+  return dbgWaitFor(tabId, OPEN_MENU_EXPR, { timeout, interval: 120 });
 }
 
-async function dbgFindResearchMenuItem(tabId, { timeout = 2400 } = {}) {
-  const expr = buildEvalWithResearchHelpers(`
+const RESEARCH_MENU_ITEM_EXPR = buildEvalWithResearchHelpers(`
     const selectors = [
       '[role=\"menuitemradio\"]',
       '[role=\"menuitem\"]',
@@ -268,7 +315,9 @@ async function dbgFindResearchMenuItem(tabId, { timeout = 2400 } = {}) {
     }
     return null;
   `);
-  return dbgWaitFor(tabId, expr, { timeout, interval: 120 });
+
+async function dbgFindResearchMenuItem(tabId, { timeout = 2400 } = {}) {
+  return dbgWaitFor(tabId, RESEARCH_MENU_ITEM_EXPR, { timeout, interval: 120 });
 }
 
 async function dbgSendEscape(tabId) {
@@ -294,26 +343,44 @@ async function dbgTrustedClickXY(tabId, x, y) {
   await dbgSend(tabId, 'Input.dispatchMouseEvent', { type: 'mouseReleased', x, y, button: 'left', buttons: 1, clickCount: 1 });
 }
 
+const CHATGPT_UI_READY_EXPR = buildEvalWithResearchHelpers(`
+    const editor = document.querySelector('#prompt-textarea, .ProseMirror, [contenteditable="true"]');
+    if (!editor) return false;
+    const candidates = Array.from(document.querySelectorAll('button[aria-label], button[aria-haspopup="menu"]')).filter(isVisible);
+    return candidates.some((btn) => {
+      const label = normalizeText((btn.getAttribute('aria-label') || '') + ' ' + (btn.textContent || ''));
+      return label.includes('model');
+    });
+  `);
+
+const RESEARCH_ACTIVE_EXPR = buildEvalWithResearchHelpers(`
+    const heading = document.querySelector('h1');
+    if (heading && /what are you researching/i.test(heading.textContent || '')) return true;
+    const pills = Array.from(document.querySelectorAll('button, [role="button"], .pill, .tag, .badge'));
+    if (pills.some((pill) => researchPattern.test(normalizeText(pill.textContent || pill.getAttribute('aria-label') || '')))) return true;
+    const modelBtn = Array.from(document.querySelectorAll('button[aria-label], button[aria-haspopup="menu"]')).find((btn) => {
+      const label = normalizeText((btn.getAttribute('aria-label') || '') + ' ' + (btn.textContent || ''));
+      return label.includes('model');
+    });
+    if (modelBtn && modelLabelIndicatesResearch(modelBtn)) return true;
+    const sourcesBtn = Array.from(document.querySelectorAll('button')).find((btn) => {
+      const text = normalizeText(btn.textContent || '');
+      return text.includes('sources');
+    });
+    if (sourcesBtn) return true;
+    return false;
+  `);
+
 async function enableChatGPTResearchViaCDP(tabId, { timeoutMs = 6000 } = {}) {
   console.log('[CDP] Starting ChatGPT Research mode activation via debugger...');
   await dbgAttach(tabId);
   try {
-    await dbgSend(tabId, 'Runtime.enable');
-    await dbgSend(tabId, 'DOM.enable');
-    await dbgSend(tabId, 'Console.enable');
+    await dbgEnableDomains(tabId, ['Runtime', 'DOM', 'Console']);
 
     console.log('[CDP] Waiting for ChatGPT UI to be ready...');
     const pageReady = await dbgWaitFor(
       tabId,
-      buildEvalWithResearchHelpers(`
-        const editor = document.querySelector('#prompt-textarea, .ProseMirror, [contenteditable="true"]');
-        if (!editor) return false;
-        const candidates = Array.from(document.querySelectorAll('button[aria-label], button[aria-haspopup="menu"]')).filter(isVisible);
-        return candidates.some((btn) => {
-          const label = normalizeText((btn.getAttribute('aria-label') || '') + ' ' + (btn.textContent || ''));
-          return label.includes('model');
-        });
-      `),
+      CHATGPT_UI_READY_EXPR,
       { timeout: Math.min(timeoutMs, 5000) }
     );
 
@@ -415,23 +482,7 @@ async function enableChatGPTResearchViaCDP(tabId, { timeoutMs = 6000 } = {}) {
     console.log('[CDP] Verifying Research mode activation...');
     const activated = await dbgWaitFor(
       tabId,
-      buildEvalWithResearchHelpers(`
-        const heading = document.querySelector('h1');
-        if (heading && /what are you researching/i.test(heading.textContent || '')) return true;
-        const pills = Array.from(document.querySelectorAll('button, [role="button"], .pill, .tag, .badge'));
-        if (pills.some((pill) => researchPattern.test(normalizeText(pill.textContent || pill.getAttribute('aria-label') || '')))) return true;
-        const modelBtn = Array.from(document.querySelectorAll('button[aria-label], button[aria-haspopup="menu"]')).find((btn) => {
-          const label = normalizeText((btn.getAttribute('aria-label') || '') + ' ' + (btn.textContent || ''));
-          return label.includes('model');
-        });
-        if (modelBtn && modelLabelIndicatesResearch(modelBtn)) return true;
-        const sourcesBtn = Array.from(document.querySelectorAll('button')).find((btn) => {
-          const text = normalizeText(btn.textContent || '');
-          return text.includes('sources');
-        });
-        if (sourcesBtn) return true;
-        return false;
-      `),
+      RESEARCH_ACTIVE_EXPR,
       { timeout: 2500, interval: 180 }
     );
 
@@ -465,14 +516,12 @@ function sanitizeTitle(title) {
 }
 
 function getProviderUrl(providerKey, opts = {}) {
-  const p = PROVIDERS[providerKey];
-  if (!p) throw new Error(`Unknown provider: ${providerKey}`);
-  if (providerKey === 'CHATGPT') {
-    if (opts.research) return p.urls.research;
-    if (opts.incognito) return p.urls.incognito;
-    return p.urls.base;
-  }
-  return p.urls.base;
+  if (!PROVIDER_KEYS.has(providerKey)) throw new Error(`Unknown provider: ${providerKey}`);
+  // Variant URLs live on the provider entry; providers without one use base
+  const { urls } = PROVIDERS[providerKey];
+  if (opts.research && urls.research) return urls.research;
+  if (opts.incognito && urls.incognito) return urls.incognito;
+  return urls.base;
 }
 
 // ============================================================================
@@ -491,6 +540,15 @@ async function loadState() {
   };
 }
 
+/**
+ * Cheap membership check against tabIndex only, so browser-wide tab events
+ * for unrelated tabs do not load and rewrite the whole session state.
+ */
+async function isTrackedTab(tabId) {
+  const { tabIndex } = await chrome.storage.local.get(['tabIndex']);
+  return !!(tabIndex && tabIndex[tabId]);
+}
+
 async function saveState(next) {
   await chrome.storage.local.set(next);
 }
@@ -512,7 +570,7 @@ async function updateState(updater) {
 async function ensureTabGroup(windowId, title, color = DEFAULT_COLOR) {
   try {
     const groupTitle = String(title || 'llm-burst').slice(0, 80);
-    const groupColor = ALLOWED_COLORS.has(color) ? color : DEFAULT_COLOR;
+    const groupColor = normalizeGroupColor(color);
 
     const existingGroups = await chrome.tabGroups.query({ title: groupTitle, windowId });
 
@@ -553,7 +611,7 @@ async function addTabsToGroup(tabIds, groupId = null, groupOptions = {}) {
       if (groupOptions.title || groupOptions.color) {
         await chrome.tabGroups.update(newGroupId, {
           title: groupOptions.title || 'llm-burst',
-          color: ALLOWED_COLORS.has(groupOptions.color) ? groupOptions.color : DEFAULT_COLOR,
+          color: normalizeGroupColor(groupOptions.color),
           collapsed: false
         });
       }
@@ -580,16 +638,15 @@ async function openTabs(urls, options = {}) {
   } = options;
 
   try {
-    const tabs = [];
-
-    for (let i = 0; i < urls.length; i++) {
-      const tab = await chrome.tabs.create({
-        url: urls[i],
-        windowId: windowId,
-        active: active && i === 0
-      });
-      tabs.push(tab);
-    }
+    const tabs = await Promise.all(
+      urls.map((url, i) =>
+        chrome.tabs.create({
+          url,
+          windowId: windowId,
+          active: active && i === 0
+        })
+      )
+    );
 
     if (grouped && tabs.length > 0) {
       const tabIds = tabs.map((t) => t.id);
@@ -613,17 +670,25 @@ async function openTabs(urls, options = {}) {
 // Window/Session Tracking (legacy maps)
 // ============================================================================
 
+function persistLegacyWindowMaps() {
+  return chrome.storage.local.set({
+    sessionWindows: Array.from(sessionWindows, ([k, v]) => [k, Array.from(v)]),
+    windowSessions: Array.from(windowSessions)
+  });
+}
+
 function trackWindowSession(sessionId, windowId) {
+  // Most provider tabs land in an already-tracked window; skip the rewrite.
+  if (windowSessions.get(windowId) === sessionId && sessionWindows.get(sessionId)?.has(windowId)) {
+    return;
+  }
   if (!sessionWindows.has(sessionId)) {
     sessionWindows.set(sessionId, new Set());
   }
   sessionWindows.get(sessionId).add(windowId);
   windowSessions.set(windowId, sessionId);
 
-  chrome.storage.local.set({
-    sessionWindows: Array.from(sessionWindows.entries()).map(([k, v]) => [k, Array.from(v)]),
-    windowSessions: Array.from(windowSessions.entries())
-  });
+  persistLegacyWindowMaps();
 }
 
 // ============================================================================
@@ -631,45 +696,76 @@ function trackWindowSession(sessionId, windowId) {
 // ============================================================================
 
 /**
- * Ensure a provider tab exists for a session. Creates and groups it if missing.
- * Returns { tab, created, groupId }
+ * Find or create tabs for several providers of one session. Existing tabs are
+ * looked up and missing ones created concurrently; the first provider's tab
+ * is activated unless activateFirst is false. Callers that already hold the
+ * session record may pass it as `session` to skip reloading state. New tabs
+ * are not yet grouped or recorded, see registerProviderTabs.
+ * Returns { tabs: { [provider]: { tabId, windowId, groupId, created } }, created }
  */
-async function ensureProviderTab(sessionId, providerKey, options, title, activate = false) {
-  const { sessions, tabIndex } = await loadState();
-  const sess = sessions[sessionId];
+async function createProviderTabs(sessionId, providers, options, { activateFirst = true, session = null } = {}) {
+  const sess = session || (await loadState()).sessions[sessionId];
   if (!sess) {
     throw new Error(`Session not found: ${sessionId}`);
   }
 
-  const existing = sess.tabs?.[providerKey];
-  if (existing) {
-    try {
-      const tab = await chrome.tabs.get(existing.tabId);
-      return { tab, created: false, groupId: existing.groupId || null };
-    } catch {
-      // fall through to recreate
+  // Chrome handles the create calls in the order they are issued.
+  const opened = await Promise.all(providers.map(async (provider, i) => {
+    const existing = sess.tabs?.[provider];
+    if (existing) {
+      try {
+        const tab = await chrome.tabs.get(existing.tabId);
+        return { provider, tab, groupId: existing.groupId || null, created: false };
+      } catch {
+        // fall through to recreate
+      }
     }
+    const url = getProviderUrl(provider, options || {});
+    const tab = await chrome.tabs.create({ url, active: activateFirst && i === 0 });
+    return { provider, tab, url, groupId: null, created: true };
+  }));
+
+  const tabs = {};
+  for (const { provider, tab, groupId, created } of opened) {
+    tabs[provider] = { tabId: tab.id, windowId: tab.windowId, groupId, created };
+  }
+  return { tabs, created: opened.filter((entry) => entry.created) };
+}
+
+/**
+ * Group newly created provider tabs with a single chrome.tabs.group call per
+ * window and record them in one state write.
+ * Returns Map<windowId, groupId>
+ */
+async function registerProviderTabs(sessionId, createdTabs, options, title) {
+  const groupIds = new Map();
+  if (createdTabs.length === 0) {
+    return groupIds;
   }
 
-  // Create a new provider tab
-  const url = getProviderUrl(providerKey, options || {});
-  const tab = await chrome.tabs.create({ url, active: !!activate });
-
-  // Group the tab
-  const groupColor = PROVIDERS[providerKey]?.color || DEFAULT_COLOR;
-  let groupId = await ensureTabGroup(tab.windowId, title, groupColor);
-  if (groupId) {
-    await chrome.tabs.group({ groupId, tabIds: [tab.id] });
-  } else {
-    groupId = await addTabsToGroup([tab.id], null, {
-      windowId: tab.windowId,
-      title,
-      color: groupColor
-    });
+  // The group takes the colour of the last provider added, as it did when
+  // tabs were grouped one at a time.
+  const byWindow = new Map();
+  for (const entry of createdTabs) {
+    if (!byWindow.has(entry.tab.windowId)) {
+      byWindow.set(entry.tab.windowId, []);
+    }
+    byWindow.get(entry.tab.windowId).push(entry);
+  }
+  for (const [windowId, entries] of byWindow) {
+    const tabIds = entries.map((e) => e.tab.id);
+    const groupColor = PROVIDERS[entries[entries.length - 1].provider]?.color || DEFAULT_COLOR;
+    let groupId = await ensureTabGroup(windowId, title, groupColor);
+    if (groupId) {
+      await chrome.tabs.group({ groupId, tabIds });
+    } else {
+      groupId = await addTabsToGroup(tabIds, null, { windowId, title, color: groupColor });
+    }
+    groupIds.set(windowId, groupId);
   }
 
-  // Persist in sessions and tabIndex
-  const updated = await updateState(async (state) => {
+  // Persist all new tabs in sessions and tabIndex
+  await updateState(async (state) => {
     const s = state.sessions[sessionId] || {
       id: sessionId,
       title,
@@ -679,22 +775,24 @@ async function ensureProviderTab(sessionId, providerKey, options, title, activat
       options: options || {},
       tabs: {}
     };
+    s.tabs = s.tabs || {};
 
-    if (!s.providers.includes(providerKey)) {
-      s.providers.push(providerKey);
+    for (const { provider, tab, url } of createdTabs) {
+      if (!s.providers.includes(provider)) {
+        s.providers.push(provider);
+      }
+      s.tabs[provider] = {
+        tabId: tab.id,
+        windowId: tab.windowId,
+        groupId: groupIds.get(tab.windowId),
+        url,
+        lastInjectAt: null
+      };
+      state.tabIndex[tab.id] = { sessionId, provider };
     }
-    s.tabs = s.tabs || {};
-    s.tabs[providerKey] = {
-      tabId: tab.id,
-      windowId: tab.windowId,
-      groupId,
-      url,
-      lastInjectAt: null
-    };
     s.lastUsedAt = Date.now();
 
     state.sessions[sessionId] = s;
-    state.tabIndex[tab.id] = { sessionId, provider: providerKey };
     if (!state.sessionOrder.includes(sessionId)) {
       state.sessionOrder.push(sessionId);
     }
@@ -702,13 +800,33 @@ async function ensureProviderTab(sessionId, providerKey, options, title, activat
   });
 
   // Track window mapping (legacy)
-  try {
-    trackWindowSession(sessionId, tab.windowId);
-  } catch (e) {
-    console.warn('trackWindowSession failed:', e);
+  for (const windowId of byWindow.keys()) {
+    try {
+      trackWindowSession(sessionId, windowId);
+    } catch (e) {
+      console.warn('trackWindowSession failed:', e);
+    }
   }
 
-  return { tab, created: true, groupId };
+  return groupIds;
+}
+
+function applyGroupIds(tabs, createdTabs, groupIds) {
+  for (const { provider, tab } of createdTabs) {
+    tabs[provider].groupId = groupIds.get(tab.windowId);
+  }
+}
+
+/**
+ * Ensure tabs exist for several providers of one session, grouping and
+ * recording any that had to be created.
+ * Returns { [provider]: { tabId, windowId, groupId, created } }
+ */
+async function openProviderTabs(sessionId, providers, options, title, { activateFirst = true, session = null } = {}) {
+  const { tabs, created } = await createProviderTabs(sessionId, providers, options, { activateFirst, session });
+  const groupIds = await registerProviderTabs(sessionId, created, options, title);
+  applyGroupIds(tabs, created, groupIds);
+  return tabs;
 }
 
 function isStructuredResponse(res) {
@@ -726,18 +844,37 @@ function normalizeGrokError({ code, state, message, error, details }, fallbackMe
 }
 
 async function waitForTabStatusComplete(tabId, timeoutMs = 15000) {
-  const start = Date.now();
-  while (Date.now() - start < timeoutMs) {
-    try {
-      const tab = await chrome.tabs.get(tabId);
-      if (!tab) return false;
-      if (tab.status === 'complete') return true;
-    } catch (error) {
-      return false;
-    }
-    await delay(200);
-  }
-  return false;
+  // Event-driven: resolve on the tab's 'complete' update instead of polling
+  return new Promise((resolve) => {
+    let settled = false;
+    const finish = (value) => {
+      if (settled) return;
+      settled = true;
+      clearTimeout(timer);
+      chrome.tabs.onUpdated.removeListener(onUpdated);
+      chrome.tabs.onRemoved.removeListener(onRemoved);
+      resolve(value);
+    };
+    const onUpdated = (id, changeInfo) => {
+      if (id === tabId && changeInfo.status === 'complete') finish(true);
+    };
+    const onRemoved = (id) => {
+      if (id === tabId) finish(false);
+    };
+    const timer = setTimeout(() => finish(false), timeoutMs);
+
+    chrome.tabs.onUpdated.addListener(onUpdated);
+    chrome.tabs.onRemoved.addListener(onRemoved);
+
+    // The tab may already be loaded (or gone) before the listeners attached
+    chrome.tabs.get(tabId).then(
+      (tab) => {
+        if (!tab) finish(false);
+        else if (tab.status === 'complete') finish(true);
+      },
+      () => finish(false)
+    );
+  });
 }
 
 async function waitForContentRouter(tabId, timeoutMs = 8000) {
@@ -812,6 +949,27 @@ async function reloadAndProbeGrok(tabId, { reason = 'unknown', timeoutMs = 12000
   };
 }
 
+// Polled by recoverGrokViaCDP to classify the page after a reload
+const GROK_SNAPSHOT_EXPR = `(() => {
+  const inspector = window.llmBurst?.inspectGrokState;
+  if (typeof inspector === 'function') {
+    try { return inspector(); } catch (err) { return { state: 'error', message: err?.message || String(err) }; }
+  }
+
+  const composer = document.querySelector('textarea[aria-label="Ask Grok anything"], [contenteditable="true"][aria-label="Ask Grok anything"]');
+  if (composer) return { state: 'ready' };
+
+  if (document.querySelector('[data-cf-challenge], iframe[src*="challenges.cloudflare.com"]')) {
+    return { state: 'cloudflare-block' };
+  }
+
+  const hasSignIn = Array.from(document.querySelectorAll('a, button, [role="button"]'))
+    .some(el => /sign in/i.test((el.textContent || '').trim()));
+  if (hasSignIn) return { state: 'login-required' };
+
+  return { state: document.readyState === 'complete' ? 'unknown' : 'hydration-pending' };
+})();`;
+
 async function recoverGrokViaCDP(tabId, { timeoutMs = 12000 } = {}) {
   let attached = false;
   try {
@@ -826,8 +984,7 @@ async function recoverGrokViaCDP(tabId, { timeoutMs = 12000 } = {}) {
       }
     }
 
-    try { await dbgSend(tabId, 'Page.enable'); } catch {}
-    try { await dbgSend(tabId, 'Runtime.enable'); } catch {}
+    try { await dbgEnableDomains(tabId, ['Page', 'Runtime']); } catch {}
     try { await dbgSend(tabId, 'Page.reload', { ignoreCache: true }); } catch {}
 
     const start = Date.now();
@@ -835,25 +992,7 @@ async function recoverGrokViaCDP(tabId, { timeoutMs = 12000 } = {}) {
 
     while (Date.now() - start < timeoutMs) {
       try {
-        const snapshot = await dbgEval(tabId, `(() => {
-          const inspector = window.llmBurst?.inspectGrokState;
-          if (typeof inspector === 'function') {
-            try { return inspector(); } catch (err) { return { state: 'error', message: err?.message || String(err) }; }
-          }
-
-          const composer = document.querySelector('textarea[aria-label="Ask Grok anything"], [contenteditable="true"][aria-label="Ask Grok anything"]');
-          if (composer) return { state: 'ready' };
-
-          if (document.querySelector('[data-cf-challenge], iframe[src*="challenges.cloudflare.com"]')) {
-            return { state: 'cloudflare-block' };
-          }
-
-          const hasSignIn = Array.from(document.querySelectorAll('a, button, [role="button"]'))
-            .some(el => /sign in/i.test((el.textContent || '').trim()));
-          if (hasSignIn) return { state: 'login-required' };
-
-          return { state: document.readyState === 'complete' ? 'unknown' : 'hydration-pending' };
-        })();`);
+        const snapshot = await dbgEval(tabId, GROK_SNAPSHOT_EXPR);
 
         if (snapshot) {
           lastSnapshot = snapshot;
@@ -1046,7 +1185,7 @@ async function injectIntoTab(tabId, providerKey, payload, timeoutMs = 15000) {
  * Start a new session: open tabs for providers, group them, and inject the prompt.
  */
 async function handleNewSession(sessionId, title, providers, prompt, options) {
-  const normalizedProviders = (providers || []).filter((p) => PROVIDER_KEYS.includes(p));
+  const normalizedProviders = (providers || []).filter((p) => PROVIDER_KEYS.has(p));
   if (normalizedProviders.length === 0) {
     throw new Error('No valid providers specified');
   }
@@ -1071,42 +1210,34 @@ async function handleNewSession(sessionId, title, providers, prompt, options) {
     return state;
   });
 
-  // Open provider tabs (first one active)
-  const openResults = {};
-  for (let i = 0; i < normalizedProviders.length; i++) {
-    const provider = normalizedProviders[i];
-    const { tab, created, groupId } = await ensureProviderTab(
-      sessionId,
-      provider,
-      options,
-      finalTitle,
-      i === 0
-    );
-    openResults[provider] = { tabId: tab.id, windowId: tab.windowId, groupId: groupId || null, created };
-  }
-
-  // Inject prompt (submit) to each provider tab
+  // Open provider tabs (first one active), then group and record them while
+  // the prompt is being injected; injection only needs the tab ids.
+  const { tabs: openResults, created } = await createProviderTabs(sessionId, normalizedProviders, options);
+  const registration = registerProviderTabs(sessionId, created, options, finalTitle);
+  registration.catch(() => {}); // surfaced by the await below
+
+  // Inject prompt (submit) to each provider tab; the payload is identical
+  // for every provider, so build it once
+  const payload = {
+    mode: 'submit',
+    prompt,
+    options: { research: !!options?.research, incognito: !!options?.incognito }
+  };
   const injections = {};
-  await Promise.all(
-    normalizedProviders.map(async (provider) => {
-      const tabId = openResults[provider].tabId;
-      const res = await injectIntoTab(tabId, provider, {
-        mode: 'submit',
-        prompt,
-        options: { research: !!options?.research, incognito: !!options?.incognito }
-      });
-      injections[provider] = res;
-      if (res.ok) {
-        await updateState(async (state) => {
-          const sess = state.sessions[sessionId];
-          if (sess && sess.tabs[provider]) {
-            sess.tabs[provider].lastInjectAt = Date.now();
-          }
-          sess.lastUsedAt = Date.now();
-          return state;
-        });
-      }
-    })
+  await mapWithConcurrency(
+    normalizedProviders,
+    MAX_PARALLEL_PROVIDERS,
+    async (provider) => {
+      injections[provider] = await injectIntoTab(openResults[provider].tabId, provider, payload);
+    }
+  );
+
+  applyGroupIds(openResults, created, await registration);
+
+  // Record successful injections in a single state write
+  await recordInjections(
+    sessionId,
+    normalizedProviders.filter((p) => injections[p].ok)
   );
 
   return {
@@ -1117,6 +1248,26 @@ async function handleNewSession(sessionId, title, providers, prompt, options) {
   };
 }
 
+/**
+ * Stamp lastInjectAt for the given providers (and the session's lastUsedAt)
+ * in one state write.
+ */
+async function recordInjections(sessionId, providers) {
+  if (!providers.length) return;
+  await updateState(async (state) => {
+    const sess = state.sessions[sessionId];
+    if (!sess) return state;
+    const now = Date.now();
+    for (const provider of providers) {
+      if (sess.tabs[provider]) {
+        sess.tabs[provider].lastInjectAt = now;
+      }
+    }
+    sess.lastUsedAt = now;
+    return state;
+  });
+}
+
 /**
  * Send a follow-up prompt to an existing session's tabs.
  */
@@ -1128,26 +1279,25 @@ async function handleFollowUp(sessionId, prompt) {
   }
 
   const providers = sess.providers || [];
+
+  // Ensure tabs exist first (recreating any that were closed) in one pass
+  const opened = await openProviderTabs(sessionId, providers, sess.options, sess.title, {
+    activateFirst: false,
+    session: sess
+  });
+
+  // Inject into all provider tabs concurrently
   const results = {};
-  for (const provider of providers) {
-    // Ensure tab exists (recreate if needed)
-    const ensured = await ensureProviderTab(sessionId, provider, sess.options, sess.title, false);
-    const tabId = ensured.tab.id;
-    const res = await injectIntoTab(tabId, provider, { mode: 'followup', prompt });
-    results[provider] = res;
-    if (res.ok) {
-      await updateState(async (state) => {
-        const s = state.sessions[sessionId];
-        if (s && s.tabs[provider]) {
-          s.tabs[provider].lastInjectAt = Date.now();
-        }
-        s.lastUsedAt = Date.now();
-        return state;
-      });
-    }
-  }
+  const payload = { mode: 'followup', prompt };
+  await mapWithConcurrency(providers, MAX_PARALLEL_PROVIDERS, async (provider) => {
+    results[provider] = await injectIntoTab(opened[provider].tabId, provider, payload);
+  });
 
-  return { sessionId, injected: Object.keys(results).filter((p) => results[p].ok), results };
+  // Record successful injections in a single state write
+  const injected = providers.filter((p) => results[p].ok);
+  await recordInjections(sessionId, injected);
+
+  return { sessionId, injected, results };
 }
 
 /**
@@ -1160,11 +1310,13 @@ async function deleteSession(sessionId, closeTabs = false) {
 
   if (closeTabs) {
     const tabIds = Object.values(sess.tabs || {}).map((t) => t.tabId);
-    for (const id of tabIds) {
+    if (tabIds.length > 0) {
       try {
-        await chrome.tabs.remove(id);
+        // Close every tab in one call; this stops at the first stale tab id
+        await chrome.tabs.remove(tabIds);
       } catch {
-        // ignore
+        // Some tab was already gone - close the rest individually, in parallel
+        await Promise.all(tabIds.map((id) => chrome.tabs.remove(id).catch(() => {})));
       }
     }
   }
@@ -1191,28 +1343,45 @@ async function deleteSession(sessionId, closeTabs = false) {
     }
   }
   sessionWindows.delete(sessionId);
-  await chrome.storage.local.set({
-    sessionWindows: Array.from(sessionWindows.entries()).map(([k, v]) => [k, Array.from(v)]),
-    windowSessions: Array.from(windowSessions.entries())
-  });
+  await persistLegacyWindowMaps();
 
   return { ok: true, deleted: true };
 }
 
+// In-flight prune pass shared by concurrent callers (startup + popup requests)
+let pruneInFlight = null;
+
 /**
  * Prune sessions by removing entries for tabs that no longer exist.
+ * Concurrent calls share a single pass instead of each probing every tab.
+ * Callers that have already read the state may pass it in to skip a reload.
  */
-async function pruneSessions() {
-  const state = await loadState();
+function pruneSessions(preloadedState = null) {
+  if (!pruneInFlight) {
+    pruneInFlight = runPruneSessions(preloadedState).finally(() => {
+      pruneInFlight = null;
+    });
+  }
+  return pruneInFlight;
+}
+
+async function runPruneSessions(preloadedState) {
+  const state = preloadedState || await loadState();
+  const entries = Object.entries(state.sessions);
+  if (entries.length === 0) {
+    return 0;
+  }
+
+  // One query for every open tab instead of a chrome.tabs.get per mapping
+  const liveTabIds = new Set((await chrome.tabs.query({})).map((tab) => tab.id));
+  const removedSessions = new Set();
   let pruned = 0;
 
-  for (const [sessionId, sess] of Object.entries(state.sessions)) {
+  for (const [sessionId, sess] of entries) {
     const providers = Object.keys(sess.tabs || {});
     for (const provider of providers) {
       const info = sess.tabs[provider];
-      try {
-        await chrome.tabs.get(info.tabId);
-      } catch {
+      if (!liveTabIds.has(info.tabId)) {
         // Tab gone - remove mapping
         delete sess.tabs[provider];
         delete state.tabIndex[info.tabId];
@@ -1222,12 +1391,18 @@ async function pruneSessions() {
     // Remove empty sessions
     if (Object.keys(sess.tabs || {}).length === 0) {
       delete state.sessions[sessionId];
-      state.sessionOrder = state.sessionOrder.filter((id) => id !== sessionId);
+      removedSessions.add(sessionId);
       pruned += 1;
     }
   }
+  if (removedSessions.size > 0) {
+    state.sessionOrder = state.sessionOrder.filter((id) => !removedSessions.has(id));
+  }
 
-  await saveState(state);
+  // Nothing stale: skip rewriting the whole state
+  if (pruned > 0) {
+    await saveState(state);
+  }
   return pruned;
 }
 
@@ -1235,11 +1410,40 @@ async function pruneSessions() {
 // Auto-Naming via Gemini API (chrome.storage.sync for creds)
 // ============================================================================
 
+// Cached Gemini credentials; cleared whenever the Options page changes them.
+let geminiCredsCache = null;
+
+chrome.storage.onChanged.addListener((changes, areaName) => {
+  if (areaName === 'sync' && (changes.geminiApiKey || changes.geminiModel)) {
+    geminiCredsCache = null;
+  }
+});
+
+async function getGeminiCreds() {
+  if (!geminiCredsCache) {
+    geminiCredsCache = chrome.storage.sync.get(['geminiApiKey', 'geminiModel']).catch((error) => {
+      geminiCredsCache = null;
+      throw error;
+    });
+  }
+  return geminiCredsCache;
+}
+
+// Fixed instruction header for auto-naming; the prompt text is appended.
+const AUTONAME_INSTRUCTIONS = [
+  'Propose a short, distinctive tab‑group title for this conversation.',
+  'Aim for 1–3 words (ideally two); go longer only if needed to clearly disambiguate from similar topics.',
+  'Use Title Case. No emojis, brackets, quotes, code fences, or trailing punctuation.',
+  'Include a concrete qualifier when helpful (e.g., product, jurisdiction, framework, year).',
+  'Avoid generic labels (Chat, Notes, Draft, Brainstorm). Prefer a title that reads well in a browser tab; ≤ 24 characters when reasonable.',
+  '',
+  'Return only the title text.',
+  '',
+  ''
+].join('\n');
+
 async function autoNamePrompt(text, { timeoutMs = 15000, modelOverride } = {}) {
-  const { geminiApiKey = '', geminiModel = '' } = await chrome.storage.sync.get([
-    'geminiApiKey',
-    'geminiModel'
-  ]);
+  const { geminiApiKey = '', geminiModel = '' } = await getGeminiCreds();
   const apiKey = (geminiApiKey || '').trim();
   if (!apiKey) {
     console.warn('[llm-burst] Auto-naming failed: No Gemini API key configured');
@@ -1252,17 +1456,7 @@ async function autoNamePrompt(text, { timeoutMs = 15000, modelOverride } = {}) {
   }
   console.log('[llm-burst] Auto-naming with model:', model);
 
-  const prompt = [
-    'Propose a short, distinctive tab‑group title for this conversation.',
-    'Aim for 1–3 words (ideally two); go longer only if needed to clearly disambiguate from similar topics.',
-    'Use Title Case. No emojis, brackets, quotes, code fences, or trailing punctuation.',
-    'Include a concrete qualifier when helpful (e.g., product, jurisdiction, framework, year).',
-    'Avoid generic labels (Chat, Notes, Draft, Brainstorm). Prefer a title that reads well in a browser tab; ≤ 24 characters when reasonable.',
-    '',
-    'Return only the title text.',
-    '',
-    String(text).slice(0, 10000) // cap input size
-  ].join('\n');
+  const prompt = AUTONAME_INSTRUCTIONS + String(text).slice(0, 10000); // cap input size
 
   // Build URL with proper model path - don't encode the forward slash in "models/"
   const url = `https://generativelanguage.googleapis.com/v1beta/${model}:generateContent?key=${encodeURIComponent(apiKey)}`;
@@ -1387,7 +1581,8 @@ chrome.runtime.onMessage.addListener((message, sender, sendResponse) => {
         // New Session API (for popup)
         // -------------------------------------------------------------------
         case 'llmburst-get-sessions': {
-          const { sessions, sessionOrder } = await loadState();
+          // Only the sessions and their order are returned; skip reading tabIndex
+          const { sessions = {}, sessionOrder = [] } = await chrome.storage.local.get(['sessions', 'sessionOrder']);
           sendResponse({ ok: true, sessions, order: sessionOrder });
           break;
         }
@@ -1478,7 +1673,7 @@ chrome.runtime.onMessage.addListener((message, sender, sendResponse) => {
             });
             await chrome.tabGroups.update(groupId, { 
               title,
-              color: ALLOWED_COLORS.has(color) ? color : DEFAULT_COLOR,
+              color: normalizeGroupColor(color),
               collapsed: false 
             });
           }
@@ -1571,17 +1766,24 @@ async function combineWindows(sessionId, targetWindowId = null) {
       throw new Error(`No windows found for session ${sessionId}`);
     }
 
+    // Query every session window's tabs concurrently, once; the results both
+    // pick the target window and drive the moves below.
+    const tabsByWindow = new Map();
+    await Promise.all(Array.from(windowIds, async (winId) => {
+      try {
+        tabsByWindow.set(winId, await chrome.tabs.query({ windowId: winId }));
+      } catch (e) {
+        windowIds.delete(winId);
+      }
+    }));
+
     if (!targetWindowId) {
       let maxTabs = 0;
       for (const winId of windowIds) {
-        try {
-          const tabs = await chrome.tabs.query({ windowId: winId });
-          if (tabs.length > maxTabs) {
-            maxTabs = tabs.length;
-            targetWindowId = winId;
-          }
-        } catch (e) {
-          windowIds.delete(winId);
+        const tabs = tabsByWindow.get(winId) || [];
+        if (tabs.length > maxTabs) {
+          maxTabs = tabs.length;
+          targetWindowId = winId;
         }
       }
     }
@@ -1595,7 +1797,7 @@ async function combineWindows(sessionId, targetWindowId = null) {
       if (winId === targetWindowId) continue;
 
       try {
-        const tabs = await chrome.tabs.query({ windowId: winId });
+        const tabs = tabsByWindow.get(winId) || [];
         if (tabs.length > 0) {
           const tabIds = tabs.map((t) => t.id);
           await chrome.tabs.move(tabIds, { windowId: targetWindowId, index: -1 });
@@ -1647,8 +1849,12 @@ chrome.runtime.onStartup.addListener(async () => {
       }
     }
 
-    // Prune sessions on startup
-    const pruned = await pruneSessions();
+    // Prune sessions on startup, reusing the state read above
+    const pruned = await pruneSessions({
+      sessions: data.sessions || {},
+      tabIndex: data.tabIndex || {},
+      sessionOrder: data.sessionOrder || []
+    });
 
     console.log('LLM Burst Helper initialized', {
       sessions: Object.keys(data.sessions || {}).length,
@@ -1671,14 +1877,12 @@ chrome.windows.onRemoved.addListener(async (windowId) => {
         sessionWindows.delete(sessionId);
       }
     }
-    await chrome.storage.local.set({
-      sessionWindows: Array.from(sessionWindows.entries()).map(([k, v]) => [k, Array.from(v)]),
-      windowSessions: Array.from(windowSessions.entries())
-    });
+    await persistLegacyWindowMaps();
   }
 
   // Additionally, remove any session tabs that belonged to this window
   await updateState(async (state) => {
+    const removedSessions = new Set();
     for (const [sid, sess] of Object.entries(state.sessions)) {
       const providers = Object.keys(sess.tabs || {});
       for (const provider of providers) {
@@ -1690,14 +1894,29 @@ chrome.windows.onRemoved.addListener(async (windowId) => {
       }
       if (Object.keys(sess.tabs || {}).length === 0) {
         delete state.sessions[sid];
-        state.sessionOrder = state.sessionOrder.filter((id) => id !== sid);
+        removedSessions.add(sid);
       }
     }
+    if (removedSessions.size > 0) {
+      state.sessionOrder = state.sessionOrder.filter((id) => !removedSessions.has(id));
+    }
     return state;
   });
 });
 
-chrome.tabs.onRemoved.addListener(async (tabId) => {
+chrome.tabs.onRemoved.addListener(async (tabId, removeInfo) => {
+  if (removeInfo?.isWindowClosing) {
+    // windows.onRemoved drops every tab recorded under the closing window in
+    // a single write; only handle tabs whose recorded window is stale.
+    const { tabIndex = {}, sessions = {} } = await chrome.storage.local.get(['tabIndex', 'sessions']);
+    const idx = tabIndex[tabId];
+    if (!idx) return;
+    if (sessions[idx.sessionId]?.tabs?.[idx.provider]?.windowId === removeInfo.windowId) return;
+  } else if (!(await isTrackedTab(tabId))) {
+    // Most closed tabs are not provider tabs; skip the full state rewrite for those
+    return;
+  }
+
   // Remove mappings for this tab
   await updateState(async (state) => {
     const idx = state.tabIndex[tabId];
@@ -1718,17 +1937,14 @@ chrome.tabs.onRemoved.addListener(async (tabId) => {
 });
 
 chrome.tabs.onUpdated.addListener(async (tabId, changeInfo, tab) => {
-  if (changeInfo.url) {
-    await updateState(async (state) => {
-      const idx = state.tabIndex[tabId];
-      if (idx) {
-        const sess = state.sessions[idx.sessionId];
-        if (sess && sess.tabs[idx.provider]) {
-          sess.tabs[idx.provider].url = changeInfo.url;
-        }
-      }
-      return state;
-    });
+  if (changeInfo.url && (await isTrackedTab(tabId))) {
+    const state = await loadState();
+    const idx = state.tabIndex[tabId];
+    const entry = idx && state.sessions[idx.sessionId]?.tabs?.[idx.provider];
+    // Skip the write when the recorded URL already matches
+    if (!entry || entry.url === changeInfo.url) return;
+    entry.url = changeInfo.url;
+    await saveState(state);
   }
 });
 
@@ -20,6 +20,11 @@
   ns.injectors = ns.injectors || {};
 
   const u = ns.utils || {};
+
+  // Send-button polling: check soon and often, giving up at the same ~3s
+  // deadline as the old 1s delay followed by four 500ms retries.
+  const SEND_BUTTON_POLL_MS = 150;
+  const SEND_BUTTON_MAX_ATTEMPTS = 20;
   const wait = u.wait || ((ms) => new Promise((resolve) => setTimeout(resolve, Number(ms) || 0)));
   const waitUntil = u.waitUntil || ((condition, timeout = 5000, interval = 100) => {
     return new Promise((resolve, reject) => {
@@ -165,10 +170,9 @@
     return null;
   }
 
-  function researchRegex() {
-    // covers "Pro Research", "Deep Research", "Research-grade intelligence"
-    return /(?:\b(?:pro\s*)?(?:deep\s*)?research(?:-grade)?\b)/i;
-  }
+  // covers "Pro Research", "Deep Research", "Research-grade intelligence".
+  // No g flag, so the shared instance carries no lastIndex state.
+  const RESEARCH_REGEX = /(?:\b(?:pro\s*)?(?:deep\s*)?research(?:-grade)?\b)/i;
 
   function modelLabelIndicatesResearch(btn) {
     const txt = normalizeText(btn?.getAttribute('aria-label') || btn?.textContent || '');
@@ -291,12 +295,12 @@
               if (!menuOpen) throw Object.assign(new Error('E_MENU_NOT_OPEN'), { code: 'E_MENU_NOT_OPEN' });
 
               // Require at least a few items and stability
-              const item = findMenuItemByText(menuOpen, researchRegex());
+              const item = findMenuItemByText(menuOpen, RESEARCH_REGEX);
               if (!item) {
                 // If not found, let it stabilize a bit more and retry once per attempt
                 await waitForStableSubtree(menuOpen, { stableForMs: 220, timeoutMs: 1200 });
               }
-              const researchItem = findMenuItemByText(menuOpen, researchRegex());
+              const researchItem = findMenuItemByText(menuOpen, RESEARCH_REGEX);
               if (!researchItem) throw Object.assign(new Error('E_OPTION_NOT_FOUND'), { code: 'E_OPTION_NOT_FOUND' });
 
               await clickInteractable(researchItem);
@@ -334,7 +338,7 @@
                 keyTarget?.dispatchEvent(new KeyboardEvent('keydown', { key: k, bubbles: true }));
                 await sleep(100);
                 const active = document.activeElement;
-                if (active && researchRegex().test(normalizeText(active.textContent))) {
+                if (active && RESEARCH_REGEX.test(normalizeText(active.textContent))) {
                   active.dispatchEvent(new KeyboardEvent('keydown', { key: 'Enter', bubbles: true }));
                   const okv = await verifyResearchActive({ deadlineMs: 4000 });
                   if (okv) return true;
@@ -347,7 +351,7 @@
                 keyTarget?.dispatchEvent(new KeyboardEvent('keydown', { key: 'ArrowDown', bubbles: true }));
                 await sleep(60);
                 const active = document.activeElement;
-                if (active && researchRegex().test(normalizeText(active.textContent))) {
+                if (active && RESEARCH_REGEX.test(normalizeText(active.textContent))) {
                   active.dispatchEvent(new KeyboardEvent('keydown', { key: 'Enter', bubbles: true }));
                   const okv = await verifyResearchActive({ deadlineMs: 4000 });
                   if (okv) return true;
@@ -434,7 +438,7 @@
                 const menu = await waitForMenuOpenStable({ timeoutMs: 1200 });
                 if (menu) {
                   const checkedItem = menu.querySelector('[role="menuitemradio"][aria-checked="true"], [role="menuitem"][aria-selected="true"]');
-                  if (checkedItem && researchRegex().test(normalizeText(checkedItem.textContent))) {
+                  if (checkedItem && RESEARCH_REGEX.test(normalizeText(checkedItem.textContent))) {
                     console.log('✅ Research verified via menu aria-checked');
                     // Close menu - try multiple approaches
                     try { menu.dispatchEvent(new KeyboardEvent('keydown', { key: 'Escape', bubbles: true })); } catch {}
@@ -666,8 +670,8 @@
 
               // Wait for send button with retry logic
               let attempts = 0;
-              const maxAttempts = 5;
-              const checkInterval = 500;
+              const maxAttempts = SEND_BUTTON_MAX_ATTEMPTS;
+              const checkInterval = SEND_BUTTON_POLL_MS;
 
               const checkForSendButton = () => {
                 attempts++;
@@ -703,8 +707,8 @@
                 resolve();
               };
 
-              // Start checking after initial delay
-              setTimeout(checkForSendButton, 1000); // Give time for the button to appear after text is entered
+              // Start checking shortly after the text is entered
+              setTimeout(checkForSendButton, checkInterval);
             })
             .catch((e) => {
               reject(e?.message || String(e));
@@ -752,8 +756,8 @@
 
         // Wait for send button with retry logic
         let attempts = 0;
-        const maxAttempts = 5;
-        const checkInterval = 500;
+        const maxAttempts = SEND_BUTTON_MAX_ATTEMPTS;
+        const checkInterval = SEND_BUTTON_POLL_MS;
 
         const checkForSendButton = () => {
           attempts++;
@@ -796,8 +800,8 @@
           resolve();
         };
 
-        // Start checking after initial delay
-        setTimeout(checkForSendButton, 1000); // Give time for the button to appear after text is entered
+        // Start checking shortly after the text is entered
+        setTimeout(checkForSendButton, checkInterval);
       } catch (error) {
         reject(`Error: ${error}`);
       }
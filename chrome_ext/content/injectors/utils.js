@@ -301,6 +301,29 @@
   // DOM finders
   // ---------------------------------------------------------------------------
 
+  // Parsed selector lists. Finders run inside polling loops, so parse each
+  // selector string (or array) once instead of re-splitting on every tick.
+  const selectorListsByString = new Map();
+  const selectorListsByArray = new WeakMap();
+
+  /**
+   * Normalize selectors into a cached list of trimmed, non-empty selectors.
+   * @param {string|string[]} selectors
+   * @returns {string[]}
+   */
+  function toSelectorList(selectors) {
+    const isArray = Array.isArray(selectors);
+    const key = isArray ? selectors : String(selectors);
+    const cache = isArray ? selectorListsByArray : selectorListsByString;
+    let list = cache.get(key);
+    if (!list) {
+      const raw = isArray ? selectors : key.split(',');
+      list = raw.map((sel) => String(sel || '').trim()).filter(Boolean);
+      cache.set(key, list);
+    }
+    return list;
+  }
+
   /**
    * Find the first element that matches any selector, optionally requiring visibility.
    * @param {string|string[]} selectors
@@ -308,10 +331,7 @@
    * @returns {Element|null}
    */
   utils.findFirst = function findFirst(selectors, { root = document, visibleOnly = true } = {}) {
-    const list = Array.isArray(selectors) ? selectors : String(selectors).split(',');
-    for (const raw of list) {
-      const sel = String(raw || '').trim();
-      if (!sel) continue;
+    for (const sel of toSelectorList(selectors)) {
       const el = root.querySelector(sel);
       if (el && (!visibleOnly || utils.visible(el))) return el;
     }
@@ -360,10 +380,7 @@
    * @returns {HTMLElement|null}
    */
   utils.findEnabledButton = function findEnabledButton(candidates) {
-    const arr = Array.isArray(candidates) ? candidates : String(candidates).split(',');
-    for (const selRaw of arr) {
-      const sel = String(selRaw || '').trim();
-      if (!sel) continue;
+    for (const sel of toSelectorList(candidates)) {
       const el = document.querySelector(sel);
       if (el && utils.visible(el) && !utils.isDisabled(el)) {
         return /** @type {HTMLElement} */ (el);
@@ -2,6 +2,7 @@
   'use strict';
 
   const els = {};
+  const ALL_PROVIDERS = ['CHATGPT', 'CLAUDE', 'GEMINI', 'GROK'];
 
   function $(id) { return document.getElementById(id); }
 
@@ -72,7 +73,7 @@
       els.defaultResearch.checked = !!settings.defaultResearch;
       els.defaultIncognito.checked = !!settings.defaultIncognito;
       els.sendOnEnter.checked = !!settings.sendOnEnter;
-      setSelectedProviders(settings.defaultProviders || ['CHATGPT', 'CLAUDE', 'GEMINI', 'GROK']);
+      setSelectedProviders(settings.defaultProviders || ALL_PROVIDERS);
 
       setStatus('Loaded.', 'info');
     } catch (e) {
@@ -111,7 +112,7 @@
     els.defaultResearch.checked = false;
     els.defaultIncognito.checked = false;
     els.sendOnEnter.checked = false;
-    setSelectedProviders(['CHATGPT', 'CLAUDE', 'GEMINI', 'GROK']);
+    setSelectedProviders(ALL_PROVIDERS);
     els.geminiModel.value = '';
     setStatus('Defaults restored (not yet saved).', 'info');
   }
@@ -17,6 +17,18 @@
   // Store cleanup functions for event listeners
   const cleanupFunctions = [];
 
+  // Formatter for the fallback "Session <time>" title, built once
+  const sessionTimeFormat = new Intl.DateTimeFormat(undefined, {
+    hour: 'numeric',
+    minute: '2-digit',
+    second: '2-digit'
+  });
+
+  // Utility: true if text has any non-whitespace character. Cheaper than
+  // trim() on large prompts since it stops at the first match.
+  const NON_WHITESPACE = /\S/;
+  function hasText(text) { return !!text && NON_WHITESPACE.test(text); }
+
   // Utility: wait
   function sleep(ms) { return new Promise(r => setTimeout(r, ms)); }
 
@@ -75,7 +87,7 @@
 
   // Draft management functions
   async function saveDraft(text) {
-    if (!text || !text.trim()) {
+    if (!hasText(text)) {
       await clearDraft();
       return;
     }
@@ -138,7 +150,7 @@
 
   function updateClearButton() {
     if (els.clearBtn) {
-      els.clearBtn.style.display = els.prompt.value.trim() ? '' : 'none';
+      els.clearBtn.style.display = hasText(els.prompt.value) ? '' : 'none';
     }
   }
 
@@ -186,8 +198,7 @@
   // Clipboard prefill (best-effort)
   async function prefillFromClipboard() {
     try {
-      const current = els.prompt.value.trim();
-      if (current.length > 0) return;
+      if (hasText(els.prompt.value)) return;
       
       // First check for saved draft
       const draft = await loadDraft();
@@ -199,9 +210,9 @@
       }
       
       // Try clipboard (often fails without user gesture)
-      const text = await navigator.clipboard.readText();
-      if (text && text.trim().length > 0) {
-        els.prompt.value = text.trim();
+      const text = (await navigator.clipboard.readText())?.trim();
+      if (text) {
+        els.prompt.value = text;
         els.prompt.dispatchEvent(new Event('input', { bubbles: true }));
         showInlineNotice('Pasted from clipboard');
       }
@@ -377,20 +388,20 @@
       
       if (els.sessionSelect) {
         // Clear ALL options except "New conversation"
-        while (els.sessionSelect.options.length > 1) {
-          els.sessionSelect.remove(1);
-        }
+        els.sessionSelect.options.length = 1;
         
-        // Add sessions in order
+        // Build the session options off-DOM and insert them in one go
+        const fragment = document.createDocumentFragment();
         order.forEach(sessionId => {
           const session = sessions[sessionId];
           if (session) {
             const option = document.createElement('option');
             option.value = sessionId;
             option.textContent = session.title || `Session ${sessionId}`;
-            els.sessionSelect.appendChild(option);
+            fragment.appendChild(option);
           }
         });
+        els.sessionSelect.appendChild(fragment);
       }
       
       clearStatus();
@@ -406,31 +417,24 @@
     state.isNewSession = isNew;
     
     // Add/remove class on app container for layout adjustment
-    const app = document.querySelector('.app');
-    if (app) {
-      app.classList.toggle('app--existing-conversation', !isNew);
+    if (els.app) {
+      els.app.classList.toggle('app--existing-conversation', !isNew);
     }
     
     // Update conditional sections
-    const conditionalSections = ['providerSection', 'optionsSection', 'titleSection'];
-    
-    conditionalSections.forEach(id => {
-      const element = document.getElementById(id);
-      if (element) {
-        if (isNew) {
-          element.classList.remove('section--hidden');
-          element.setAttribute('aria-hidden', 'false');
-        } else {
-          element.classList.add('section--hidden');
-          element.setAttribute('aria-hidden', 'true');
-        }
+    els.conditionalSections?.forEach(element => {
+      if (isNew) {
+        element.classList.remove('section--hidden');
+        element.setAttribute('aria-hidden', 'false');
+      } else {
+        element.classList.add('section--hidden');
+        element.setAttribute('aria-hidden', 'true');
       }
     });
     
     // Update send button text
-    const sendButtonText = document.getElementById('sendButtonText');
-    if (sendButtonText) {
-      sendButtonText.textContent = isNew ? 'Send' : 'Continue Thread';
+    if (els.sendButtonText) {
+      els.sendButtonText.textContent = isNew ? 'Send' : 'Continue Thread';
     }
     
     // Adjust textarea
@@ -502,7 +506,7 @@
     let result;
     if (isNew) {
       const title = els.groupTitle?.value.trim() || 
-                   `Session ${new Date().toLocaleTimeString()}`;
+                   `Session ${sessionTimeFormat.format(new Date())}`;
       
       result = await sendMessage('llmburst-start-new-session', {
         prompt,
@@ -525,18 +529,16 @@
     if (result.ok) {
       setStatus('Sent successfully!', 'success');
       els.prompt.value = '';
-      await clearDraft();
       updateClearButton();
       updateCharCount();
       autoExpandTextarea();
       
-      // Reload sessions if new one was created
-      if (isNew && result.sessionId) {
-        await loadSessions();
-        if (els.sessionSelect) {
-          els.sessionSelect.value = result.sessionId;
-          updateUIState();
-        }
+      // Clear the draft while reloading sessions if a new one was created
+      const reloadSessions = isNew && result.sessionId;
+      await Promise.all([clearDraft(), reloadSessions ? loadSessions() : null]);
+      if (reloadSessions && els.sessionSelect) {
+        els.sessionSelect.value = result.sessionId;
+        updateUIState();
       }
       
       setTimeout(() => window.close(), 1500);
@@ -632,15 +634,15 @@
     if (els.pasteBtn) {
       els.pasteBtn.addEventListener('click', async () => {
         try {
-          const text = await navigator.clipboard.readText();
-          if (text && text.trim().length > 0) {
-            els.prompt.value = text.trim();
+          const text = (await navigator.clipboard.readText())?.trim();
+          if (text) {
+            els.prompt.value = text;
             els.prompt.dispatchEvent(new Event('input', { bubbles: true }));
             els.prompt.focus();
             showInlineNotice('Pasted from clipboard');
             
             // Auto-generate title after paste only if Advanced Options is open and title is blank
-            if (state.isNewSession && !state.titleDirty && text.trim() && 
+            if (state.isNewSession && !state.titleDirty && 
                 els.advancedOptions && els.advancedOptions.open && !els.groupTitle.value) {
               setTimeout(() => generateTitle(), 500);
             }
@@ -680,7 +682,7 @@
     if (els.advancedOptions) {
       els.advancedOptions.addEventListener('toggle', () => {
         if (els.advancedOptions.open && state.isNewSession && !state.titleDirty && 
-            !els.groupTitle.value && els.prompt.value.trim()) {
+            !els.groupTitle.value && hasText(els.prompt.value)) {
           generateTitle();
         }
       });
@@ -758,6 +760,11 @@
     els.charCount = document.getElementById('charCount');
     els.draftStatus = document.getElementById('draftStatus');
     els.advancedOptions = document.getElementById('advancedOptions');
+    els.app = document.querySelector('.app');
+    els.sendButtonText = document.getElementById('sendButtonText');
+    els.conditionalSections = ['providerSection', 'optionsSection', 'titleSection']
+      .map(id => document.getElementById(id))
+      .filter(Boolean);
   }
 
   // Cleanup function to remove all event listeners
@@ -773,8 +780,11 @@
   
   // Initialize
   async function init() {
-    // Wait for DOM to be ready
-    await sleep(100);
+    // ui.js (a deferred module) renders before DOMContentLoaded, so the
+    // elements are normally present already; only wait if they are not
+    if (!document.getElementById('prompt')) {
+      await sleep(100);
+    }
     
     captureElements();
     bindEvents();
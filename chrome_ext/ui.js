@@ -5,8 +5,8 @@ export function detectMode() {
 }
 
 // Safe DOM construction helper
-const ALLOWED_EVENTS = ['click', 'change', 'input', 'focus', 'blur', 'keydown', 'compositionstart', 'compositionend'];
-const BOOLEAN_ATTRS = ['checked', 'disabled', 'hidden', 'selected', 'readonly', 'open'];
+const ALLOWED_EVENTS = new Set(['click', 'change', 'input', 'focus', 'blur', 'keydown', 'compositionstart', 'compositionend']);
+const BOOLEAN_ATTRS = new Set(['checked', 'disabled', 'hidden', 'selected', 'readonly', 'open']);
 
 function createElement(tag, attrs = {}, children = []) {
   const el = document.createElement(tag);
@@ -26,12 +26,12 @@ function createElement(tag, attrs = {}, children = []) {
     } else if (key.startsWith('on') && typeof val === 'function') {
       // Validate event handlers
       const eventName = key.slice(2).toLowerCase();
-      if (ALLOWED_EVENTS.includes(eventName)) {
+      if (ALLOWED_EVENTS.has(eventName)) {
         el.addEventListener(eventName, val);
       } else {
         console.warn(`Event handler ${key} not allowed`);
       }
-    } else if (BOOLEAN_ATTRS.includes(key)) {
+    } else if (BOOLEAN_ATTRS.has(key)) {
       el[key] = val;
     } else if (key === 'for') {
       el.setAttribute('for', val);
@@ -174,15 +174,16 @@ function createOptionsSection() {
   return section;
 }
 
+// Provider cards shown in the advanced options section
+const PROVIDER_CARDS = [
+  { id: 'CHATGPT', name: 'ChatGPT', icon: 'C', inputId: 'prov-chatgpt' },
+  { id: 'CLAUDE', name: 'Claude', icon: 'Cl', inputId: 'prov-claude' },
+  { id: 'GEMINI', name: 'Gemini', icon: 'G', inputId: 'prov-gemini' },
+  { id: 'GROK', name: 'Grok', icon: 'Gr', inputId: 'prov-grok' }
+];
+
 // Create advanced options section with providers and title
 function createAdvancedSection() {
-  const providers = [
-    { id: 'CHATGPT', name: 'ChatGPT', icon: 'C' },
-    { id: 'CLAUDE', name: 'Claude', icon: 'Cl' },
-    { id: 'GEMINI', name: 'Gemini', icon: 'G' },
-    { id: 'GROK', name: 'Grok', icon: 'Gr' }
-  ];
-  
   const section = createElement('div', {
     className: 'section',
     id: 'advancedSection'
@@ -195,7 +196,7 @@ function createAdvancedSection() {
         // Provider selection on one line (no explicit label)
         createElement('div', { id: 'providerSection' }, [
           createElement('div', { className: 'providers providers--inline providers--nowrap' }, 
-            providers.map(provider => 
+            PROVIDER_CARDS.map(provider => 
               createElement('label', {
                 className: 'provider-card provider-card--compact',
                 'data-provider': provider.id
@@ -203,7 +204,7 @@ function createAdvancedSection() {
                 createElement('input', {
                   type: 'checkbox',
                   className: 'provider-card__checkbox',
-                  id: `prov-${provider.id.toLowerCase()}`,
+                  id: provider.inputId,
                   'data-provider': provider.id
                   // Don't hardcode checked state - let defaults load from storage
                 }),